@@ -9,25 +9,31 @@ from app.cv.detector import SafetyDetector
 from app.cv.video_annotator import VideoAnnotator
 from app.cv.video_detector import VideoSafetyAnalyzer
 
-from app.logic.aggregator import aggregate_violations
+from app.logic.aggregator import summarize_violations
 from app.logic.violations import evaluate_violations
 from app.logic.context_builder import build_safety_context
 
 from app.llm.reasoner import (
     explain_safety_context,
-    explain_aggregated_violation
+    explain_aggregated_violations
 )
 
-from app.reports.pdf_reports import generate_pdf
+from app.reports.pdf_reports import SafetyReportBuilder
+from app.reports.thumbnails import ThumbnailCache
 from app.utils.zipper import create_zip
 
 # --------------------------------------------------
 app = FastAPI(title="AI Safety Monitoring System")
 
 # ----------------- INIT -----------------
-detector = SafetyDetector("models/best.pt")
-video_analyzer = VideoSafetyAnalyzer("models/best.pt")
-video_annotator = VideoAnnotator("models/best.pt")
+# INFERENCE_BACKEND=onnx runs the exported model on ONNX Runtime (CPU)
+MODEL_PATH = os.getenv("MODEL_PATH", "models/best.pt")
+
+detector = SafetyDetector(MODEL_PATH)
+video_analyzer = VideoSafetyAnalyzer(MODEL_PATH)
+video_annotator = VideoAnnotator(MODEL_PATH)
+
+FRAME_SKIP = 10     # analyze every Nth video frame
 
 UPLOAD_DIR = "uploads"
 OUTPUT_DIR = "outputs"
@@ -81,16 +87,22 @@ async def analyze_video(file: UploadFile = File(...)):
     with open(video_path, "wb") as buffer:
         shutil.copyfileobj(file.file, buffer)
 
-    events = video_analyzer.analyze(video_path)
+    events = video_analyzer.analyze(video_path, frame_skip=FRAME_SKIP)
+
+    # Frames with the same PPE context share one LLM explanation
+    explanations = {}
 
     response = []
     for e in events:
         detected_ppe, missing_ppe = build_safety_context(e["detections"])
 
-        explanation = explain_safety_context(
-            detected_ppe=detected_ppe,
-            missing_ppe=missing_ppe
-        )
+        key = (frozenset(detected_ppe), frozenset(missing_ppe))
+        if key not in explanations:
+            explanations[key] = explain_safety_context(
+                detected_ppe=detected_ppe,
+                missing_ppe=missing_ppe
+            )
+        explanation = explanations[key]
 
         response.append({
             "frame": e["frame"],
@@ -123,49 +135,57 @@ async def analyze_video_export(file: UploadFile = File(...)):
         annotated_video = f"{OUTPUT_DIR}/annotated_video.mp4"
         video_annotator.annotate(video_path, annotated_video)
 
-        # 2️⃣ Analyze video
-        events = video_analyzer.analyze(video_path)
+        # 2️⃣ Analyze video (thumbnails cached from the same pass)
+        thumbnails = ThumbnailCache()
+        events, fps, total_frames = video_analyzer.analyze_with_info(
+            video_path, frame_skip=FRAME_SKIP, thumbnails=thumbnails
+        )
+
+        # 3️⃣ PDF report
+        pdf_path = f"{OUTPUT_DIR}/safety_report.pdf"
+        report = SafetyReportBuilder(pdf_path)
 
-        # 3️⃣ Build report summary
         if not events:
-            summary = [{
-                "violation": "Analysis Summary",
-                "occurrences": 0,
-                "explanation": (
-                    "The video was processed, but no valid worker detections "
-                    "were found. Safety assessment could not be performed."
-                )
-            }]
+            report.add_violation(
+                "Analysis Summary",
+                0,
+                "The video was processed, but no valid worker detections "
+                "were found. Safety assessment could not be performed."
+            )
         else:
-            aggregated = aggregate_violations(events)
-            summary = []
+            aggregated = summarize_violations(events)
 
             if not aggregated:
-                summary.append({
-                    "violation": "PPE Compliance",
-                    "occurrences": len(events),
-                    "explanation": (
-                        "All detected workers appear to be compliant with the "
-                        "required personal protective equipment (PPE). "
-                        "No safety violations were consistently observed."
-                    )
-                })
+                report.add_violation(
+                    "PPE Compliance",
+                    len(events),
+                    "All detected workers appear to be compliant with the "
+                    "required personal protective equipment (PPE). "
+                    "No safety violations were consistently observed."
+                )
             else:
-                for violation, frames in aggregated.items():
-                    summary.append({
-                        "violation": violation,
-                        "occurrences": len(frames),
-                        "explanation": explain_aggregated_violation(
-                            violation,
-                            frames
-                        )
-                    })
-
-        # 4️⃣ PDF report
-        pdf_path = f"{OUTPUT_DIR}/safety_report.pdf"
-        generate_pdf(pdf_path, summary)
+                report.add_timeline(
+                    {v: s["frames"] for v, s in aggregated.items()},
+                    total_frames,
+                    fps,
+                    frame_skip=FRAME_SKIP
+                )
+
+                # Single batched LLM call for all violation types
+                explanations = explain_aggregated_violations(aggregated)
+
+                for violation, stats in aggregated.items():
+                    report.add_violation(
+                        violation,
+                        stats["count"],
+                        explanations[violation],
+                        thumbnails=thumbnails.get(violation),
+                        fps=fps
+                    )
+
+        report.close()
 
-        # 5️⃣ ZIP export
+        # 4️⃣ ZIP export
         zip_path = f"{OUTPUT_DIR}/safety_audit.zip"
         create_zip(zip_path, [
             annotated_video,
@@ -0,0 +1,201 @@
+import ast
+import os
+
+import cv2
+import numpy as np
+
+# Ultralytics predict() defaults, reused so the backends filter alike
+CONF_THRESHOLD = 0.25
+IOU_THRESHOLD = 0.7
+MAX_DET = 300
+DEFAULT_IMGSZ = 640
+
+
+class InferenceBackend:
+    """
+    Common interface for the YOLO runtimes.
+
+    predict(frame) takes a BGR image and returns
+    List[{"xyxy": (x1, y1, x2, y2), "cls": int, "conf": float}]
+    in original image pixel coordinates.
+    """
+
+    names = {}
+
+    def predict(self, frame):
+        raise NotImplementedError
+
+
+# ----------------- PYTORCH (ULTRALYTICS) -----------------
+class UltralyticsBackend(InferenceBackend):
+    def __init__(self, model_path: str, imgsz: int = None):
+        # Imported lazily: torch is heavy and not needed for ONNX
+        from ultralytics import YOLO
+
+        self.model = YOLO(model_path)
+        self.names = self.model.names
+        self.imgsz = imgsz
+
+    def predict(self, frame):
+        kwargs = {"imgsz": self.imgsz} if self.imgsz else {}
+        results = self.model(frame, **kwargs)[0]
+
+        return [
+            {
+                "xyxy": tuple(float(v) for v in box.xyxy[0]),
+                "cls": int(box.cls[0]),
+                "conf": float(box.conf[0])
+            }
+            for box in results.boxes
+        ]
+
+
+# ----------------- ONNX RUNTIME (CPU) -----------------
+class OnnxRuntimeBackend(InferenceBackend):
+    """
+    Runs a YOLO model exported with app.cv.export on ONNX Runtime.
+
+    Thresholds and class-aware NMS follow Ultralytics, but a static export
+    always pads to the full square input, while .pt inference pads only to
+    the next stride multiple. Detections are therefore close to, not
+    identical with, UltralyticsBackend; `export --validate` measures the gap.
+    """
+
+    def __init__(self, model_path: str, imgsz: int = None, providers=None):
+        import onnxruntime as ort
+
+        available = ort.get_available_providers()
+        if providers is None:
+            # OpenVINO EP is used when onnxruntime-openvino is installed
+            providers = [
+                p for p in ("OpenVINOExecutionProvider", "CPUExecutionProvider")
+                if p in available
+            ]
+
+        self.session = ort.InferenceSession(model_path, providers=providers)
+        self.input_name = self.session.get_inputs()[0].name
+
+        meta = self.session.get_modelmeta().custom_metadata_map
+        self.names = (
+            ast.literal_eval(meta["names"]) if "names" in meta else {}
+        )
+
+        # Static exports fix the input size; it must win over the config
+        input_shape = self.session.get_inputs()[0].shape
+        if isinstance(input_shape[2], int) and isinstance(input_shape[3], int):
+            self.imgsz = (input_shape[2], input_shape[3])
+        elif "imgsz" in meta:
+            self.imgsz = tuple(ast.literal_eval(meta["imgsz"]))
+        else:
+            size = imgsz or DEFAULT_IMGSZ
+            self.imgsz = (size, size)
+
+    def _letterbox(self, frame):
+        h0, w0 = frame.shape[:2]
+        h, w = self.imgsz
+        gain = min(h / h0, w / w0)
+
+        new_w, new_h = int(round(w0 * gain)), int(round(h0 * gain))
+        dw, dh = (w - new_w) / 2, (h - new_h) / 2
+
+        if (new_w, new_h) != (w0, h0):
+            frame = cv2.resize(frame, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+
+        top, bottom = int(round(dh - 0.1)), int(round(dh + 0.1))
+        left, right = int(round(dw - 0.1)), int(round(dw + 0.1))
+        frame = cv2.copyMakeBorder(
+            frame, top, bottom, left, right,
+            cv2.BORDER_CONSTANT, value=(114, 114, 114)
+        )
+
+        return frame, gain, (left, top)
+
+    def predict(self, frame):
+        h0, w0 = frame.shape[:2]
+        img, gain, (pad_x, pad_y) = self._letterbox(frame)
+
+        blob = img[:, :, ::-1].transpose(2, 0, 1)  # BGR -> RGB, HWC -> CHW
+        blob = np.ascontiguousarray(blob, dtype=np.float32)[None] / 255.0
+
+        # YOLOv8-style head: (1, 4 + num_classes, num_anchors)
+        preds = self.session.run(None, {self.input_name: blob})[0][0].T
+
+        scores = preds[:, 4:]
+        cls_ids = scores.argmax(axis=1)
+        confs = scores[np.arange(len(scores)), cls_ids]
+
+        keep = confs > CONF_THRESHOLD
+        boxes, cls_ids, confs = preds[keep, :4], cls_ids[keep], confs[keep]
+        if not len(boxes):
+            return []
+
+        xyxy = np.empty_like(boxes)
+        xyxy[:, 0] = boxes[:, 0] - boxes[:, 2] / 2
+        xyxy[:, 1] = boxes[:, 1] - boxes[:, 3] / 2
+        xyxy[:, 2] = boxes[:, 0] + boxes[:, 2] / 2
+        xyxy[:, 3] = boxes[:, 1] + boxes[:, 3] / 2
+
+        keep = _class_aware_nms(xyxy, confs, cls_ids)[:MAX_DET]
+
+        xyxy = xyxy[keep]
+        xyxy[:, [0, 2]] = ((xyxy[:, [0, 2]] - pad_x) / gain).clip(0, w0)
+        xyxy[:, [1, 3]] = ((xyxy[:, [1, 3]] - pad_y) / gain).clip(0, h0)
+
+        return [
+            {
+                "xyxy": tuple(float(v) for v in box),
+                "cls": int(cls_id),
+                "conf": float(conf)
+            }
+            for box, cls_id, conf in zip(xyxy, cls_ids[keep], confs[keep])
+        ]
+
+
+def _class_aware_nms(xyxy, confs, cls_ids, max_wh: int = 7680):
+    """
+    Same trick as Ultralytics: offset boxes per class so one NMS pass
+    never suppresses across classes. Returns kept indices by confidence.
+    """
+    offset = xyxy + (cls_ids[:, None] * max_wh)
+    x1, y1, x2, y2 = offset.T
+    areas = (x2 - x1) * (y2 - y1)
+
+    order = confs.argsort()[::-1]
+    keep = []
+
+    while order.size:
+        i = order[0]
+        keep.append(i)
+
+        xx1 = np.maximum(x1[i], x1[order[1:]])
+        yy1 = np.maximum(y1[i], y1[order[1:]])
+        xx2 = np.minimum(x2[i], x2[order[1:]])
+        yy2 = np.minimum(y2[i], y2[order[1:]])
+
+        inter = (xx2 - xx1).clip(0) * (yy2 - yy1).clip(0)
+        iou = inter / (areas[i] + areas[order[1:]] - inter)
+
+        order = order[1:][iou <= IOU_THRESHOLD]
+
+    return np.array(keep, dtype=int)
+
+
+# ----------------- FACTORY -----------------
+def load_backend(model_path: str, backend: str = None, imgsz: int = None):
+    """
+    backend: "ultralytics" | "onnx"
+    Defaults come from INFERENCE_BACKEND / INFERENCE_IMGSZ env vars.
+    """
+    backend = backend or os.getenv("INFERENCE_BACKEND", "ultralytics")
+    imgsz = imgsz or int(os.getenv("INFERENCE_IMGSZ", 0)) or None
+
+    if backend == "ultralytics":
+        return UltralyticsBackend(model_path, imgsz=imgsz)
+
+    if backend == "onnx":
+        # Allow the PyTorch weights path; export writes the .onnx beside it
+        if model_path.endswith(".pt"):
+            model_path = model_path[:-3] + ".onnx"
+        return OnnxRuntimeBackend(model_path, imgsz=imgsz)
+
+    raise ValueError(f"Unknown inference backend: {backend}")
@@ -1,6 +1,7 @@
-from ultralytics import YOLO
 import cv2
 
+from app.cv.backends import load_backend
+
 CLASS_NAMES = [
     "Gloves",
     "Hard_hat",
@@ -11,25 +12,22 @@ CLASS_NAMES = [
 ]
 
 class SafetyDetector:
-    def __init__(self, model_path: str):
-        self.model = YOLO(model_path)
+    def __init__(self, model_path: str, backend: str = None, imgsz: int = None):
+        self.model = load_backend(model_path, backend=backend, imgsz=imgsz)
 
     def detect(self, image_path: str):
         img = cv2.imread(image_path)
         if img is None:
             raise ValueError("Image not found or invalid")
 
-        results = self.model(img)[0]
         detections = []
 
-        for box in results.boxes:
-            cls_id = int(box.cls[0])
-            conf = float(box.conf[0])
-            label = CLASS_NAMES[cls_id]
+        for box in self.model.predict(img):
+            label = CLASS_NAMES[box["cls"]]
 
             detections.append({
                 "violation": label,
-                "confidence": round(conf, 3),
+                "confidence": round(box["conf"], 3),
                 "category": "person" if label == "Person" else "ppe"
             })
 
@@ -0,0 +1,172 @@
+"""
+Export the PyTorch YOLO weights to ONNX for CPU-only deployments.
+
+Usage (from backend/):
+    python -m app.cv.export --weights models/best.pt --imgsz 640 --int8 \
+        --validate path/to/sample_images
+
+Then start the API with INFERENCE_BACKEND=onnx
+(and MODEL_PATH=models/best.int8.onnx for the quantized model).
+"""
+
+import argparse
+import glob
+import os
+import time
+
+import cv2
+
+
+# ----------------- EXPORT -----------------
+def export_onnx(weights: str, imgsz: int = 640) -> str:
+    from ultralytics import YOLO
+
+    # Static shape + simplify gives the fastest CPU graph;
+    # class names and imgsz are stored in the ONNX metadata
+    return YOLO(weights).export(
+        format="onnx",
+        imgsz=imgsz,
+        dynamic=False,
+        simplify=True
+    )
+
+
+def quantize_int8(onnx_path: str) -> str:
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    int8_path = onnx_path[:-len(".onnx")] + ".int8.onnx"
+    quantize_dynamic(onnx_path, int8_path, weight_type=QuantType.QUInt8)
+
+    return int8_path
+
+
+# ----------------- ACCURACY DELTA -----------------
+def _iou(a, b):
+    x1, y1 = max(a[0], b[0]), max(a[1], b[1])
+    x2, y2 = min(a[2], b[2]), min(a[3], b[3])
+    inter = max(0.0, x2 - x1) * max(0.0, y2 - y1)
+    union = (
+        (a[2] - a[0]) * (a[3] - a[1]) +
+        (b[2] - b[0]) * (b[3] - b[1]) - inter
+    )
+    return inter / union if union > 0 else 0.0
+
+
+def _match(reference, candidate, iou_threshold: float):
+    """
+    Greedy same-class IoU matching of candidate boxes against the
+    reference (PyTorch) boxes. Returns list of (ref_box, cand_box).
+    """
+    matches = []
+    unmatched = list(candidate)
+
+    for ref in sorted(reference, key=lambda b: -b["conf"]):
+        best, best_iou = None, iou_threshold
+        for cand in unmatched:
+            if cand["cls"] != ref["cls"]:
+                continue
+            iou = _iou(ref["xyxy"], cand["xyxy"])
+            if iou >= best_iou:
+                best, best_iou = cand, iou
+
+        if best is not None:
+            unmatched.remove(best)
+            matches.append((ref, best))
+
+    return matches
+
+
+def compare_backends(reference, candidate, images, iou_threshold: float = 0.5):
+    """
+    Runs both backends over the images and reports how far the
+    candidate drifts from the reference detections.
+    """
+    processed = ref_total = cand_total = matched = 0
+    conf_deltas = []
+    ref_time = cand_time = 0.0
+
+    for path in images:
+        img = cv2.imread(path)
+        if img is None:
+            continue
+        processed += 1
+
+        start = time.perf_counter()
+        ref_boxes = reference.predict(img)
+        ref_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        cand_boxes = candidate.predict(img)
+        cand_time += time.perf_counter() - start
+
+        matches = _match(ref_boxes, cand_boxes, iou_threshold)
+
+        ref_total += len(ref_boxes)
+        cand_total += len(cand_boxes)
+        matched += len(matches)
+        conf_deltas.extend(abs(r["conf"] - c["conf"]) for r, c in matches)
+
+    # Unreadable files are skipped, so only processed images count
+    n = max(processed, 1)
+
+    return {
+        "images": processed,
+        "reference_detections": ref_total,
+        "candidate_detections": cand_total,
+        "recall_vs_reference": matched / ref_total if ref_total else 1.0,
+        "precision_vs_reference": matched / cand_total if cand_total else 1.0,
+        "mean_conf_delta": (
+            sum(conf_deltas) / len(conf_deltas) if conf_deltas else 0.0
+        ),
+        "reference_ms_per_image": 1000 * ref_time / n,
+        "candidate_ms_per_image": 1000 * cand_time / n
+    }
+
+
+def _list_images(folder: str):
+    return sorted(
+        p for ext in ("jpg", "jpeg", "png")
+        for p in glob.glob(os.path.join(folder, f"*.{ext}"))
+    )
+
+
+# ----------------- CLI -----------------
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--weights", default="models/best.pt")
+    parser.add_argument("--imgsz", type=int, default=640)
+    parser.add_argument("--int8", action="store_true",
+                        help="also write a dynamically quantized INT8 model")
+    parser.add_argument("--validate", metavar="IMAGE_DIR",
+                        help="report accuracy/latency delta vs PyTorch")
+    args = parser.parse_args()
+
+    onnx_path = export_onnx(args.weights, args.imgsz)
+    print(f"ONNX model: {onnx_path}")
+
+    exported = [onnx_path]
+    if args.int8:
+        exported.append(quantize_int8(onnx_path))
+        print(f"INT8 model: {exported[-1]}")
+
+    if not args.validate:
+        return
+
+    from app.cv.backends import OnnxRuntimeBackend, UltralyticsBackend
+
+    images = _list_images(args.validate)
+    if not images:
+        raise SystemExit(f"No images found in {args.validate}")
+
+    reference = UltralyticsBackend(args.weights, imgsz=args.imgsz)
+
+    for path in exported:
+        report = compare_backends(reference, OnnxRuntimeBackend(path), images)
+        print(f"\n{os.path.basename(path)} vs {os.path.basename(args.weights)}")
+        for key, value in report.items():
+            print(f"  {key}: {value:.3f}" if isinstance(value, float)
+                  else f"  {key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
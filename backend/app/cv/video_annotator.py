@@ -1,10 +1,12 @@
 import cv2
-from ultralytics import YOLO
 import os
 
+from app.cv.backends import load_backend
+from app.cv.detector import CLASS_NAMES
+
 class VideoAnnotator:
-    def __init__(self, model_path: str):
-        self.model = YOLO(model_path)
+    def __init__(self, model_path: str, backend: str = None, imgsz: int = None):
+        self.model = load_backend(model_path, backend=backend, imgsz=imgsz)
 
     def annotate(self, input_video: str, output_video: str):
         if not os.path.exists(input_video):
@@ -36,13 +38,12 @@ class VideoAnnotator:
             if not ret:
                 break
 
-            results = self.model(frame)[0]
-
-            for box in results.boxes:
-                x1, y1, x2, y2 = map(int, box.xyxy[0])
-                cls = int(box.cls[0])
-                conf = float(box.conf[0])
-                label = self.model.names[cls]
+            for box in self.model.predict(frame):
+                x1, y1, x2, y2 = map(int, box["xyxy"])
+                cls = box["cls"]
+                conf = box["conf"]
+                # Same labels as SafetyDetector, even if the model has no names
+                label = self.model.names.get(cls) or CLASS_NAMES[cls]
 
                 cv2.rectangle(frame, (x1, y1), (x2, y2), (0, 255, 0), 2)
                 cv2.putText(
@@ -5,14 +5,31 @@ from app.logic.violations import evaluate_violations
 
 
 class VideoSafetyAnalyzer:
-    def __init__(self, model_path: str):
-        self.detector = SafetyDetector(model_path)
+    def __init__(self, model_path: str, backend: str = None, imgsz: int = None):
+        self.detector = SafetyDetector(model_path, backend=backend, imgsz=imgsz)
 
-    def analyze(self, video_path: str, frame_skip: int = 10):
+    def analyze(self, video_path: str, frame_skip: int = 10, thumbnails=None):
+        events, _, _ = self.analyze_with_info(video_path, frame_skip, thumbnails)
+        return events
+
+    def analyze_with_info(
+        self,
+        video_path: str,
+        frame_skip: int = 10,
+        thumbnails=None
+    ):
+        """
+        Returns (events, fps, total_frames). total_frames is the number
+        of frames actually decoded, not the container metadata.
+
+        thumbnails: optional ThumbnailCache, filled from the frames
+        decoded here so the report never re-reads the video
+        """
         if not os.path.exists(video_path):
             raise ValueError("Video file does not exist")
 
         cap = cv2.VideoCapture(video_path)
+        fps = cap.get(cv2.CAP_PROP_FPS) or 25
         frame_id = 0
         events = []
 
@@ -37,11 +54,15 @@ class VideoSafetyAnalyzer:
             if result["status"] != "No person detected":
                 events.append({
                     "frame": frame_id,
+                    "timestamp": round(frame_id / fps, 2),
                     "detections": detections,
                     "violations": result["violations"],  # always list
                     "status": result["status"]
                 })
 
+                if thumbnails is not None and result["violations"]:
+                    thumbnails.add(frame_id, frame, result["violations"])
+
         cap.release()
 
-        return events
+        return events, fps, frame_id
@@ -1,6 +1,8 @@
 from langchain_ollama import OllamaLLM
 from langchain_core.prompts import PromptTemplate
 from typing import List, Dict
+import os
+import re
 
 # ----------------- LLM INIT -----------------
 llm = OllamaLLM(
@@ -53,6 +55,32 @@ Rules:
 """
 )
 
+# ----------------- BATCHED VIDEO PROMPT -----------------
+# One generation per audit instead of one per violation type
+BATCH_MODE = os.getenv("LLM_BATCH_MODE", "1") == "1"
+
+BATCH_AGGREGATED_PROMPT = PromptTemplate(
+    input_variables=["violations", "headings"],
+    template="""
+You are a workplace safety assistant.
+
+The following violations were detected in a safety video:
+
+{violations}
+
+Rules:
+- For EACH violation, explain the safety risk clearly
+- For EACH violation, explain what should be done immediately
+- Do NOT mention punishment or law
+- Be precise and professional
+
+Answer with exactly one section per violation, using these headings
+in this order and nothing before the first heading:
+
+{headings}
+"""
+)
+
 # ----------------- IMAGE / FRAME LEVEL -----------------
 def explain_safety_context(
     detected_ppe: List[str],
@@ -97,3 +125,104 @@ def explain_aggregated_violation(
     )
 
     return llm.invoke(prompt).strip()
+
+
+# ----------------- VIDEO SUMMARY (BATCHED) -----------------
+def explain_aggregated_violations(
+    summary: Dict[str, Dict]
+) -> Dict[str, str]:
+    """
+    Used for VIDEO SUMMARY with several violation types.
+    summary: output of app.logic.aggregator.summarize_violations
+
+    Returns {violation: explanation}. Violations missing from the
+    batched answer fall back to explain_aggregated_violation.
+    """
+
+    if not summary:
+        return {}
+
+    explanations = {}
+
+    if BATCH_MODE and len(summary) > 1:
+        violations = "\n".join(
+            f"- {name}: {s['count']} occurrences, "
+            f"first seen at {s['first_seen']:.1f}s, "
+            f"last seen at {s['last_seen']:.1f}s, "
+            f"spanning {s['duration']:.1f}s"
+            for name, s in summary.items()
+        )
+        headings = "\n".join(f"### {name}" for name in summary)
+
+        prompt = BATCH_AGGREGATED_PROMPT.format(
+            violations=violations,
+            headings=headings
+        )
+
+        explanations = _parse_sections(llm.invoke(prompt), list(summary))
+
+    for name, s in summary.items():
+        if not explanations.get(name):
+            explanations[name] = explain_aggregated_violation(name, s["frames"])
+
+    return {name: explanations[name] for name in summary}
+
+
+HEADING_START = re.compile(r"^\s*(#|\*\*|\d+[.)])")
+HEADING_MARKUP = re.compile(r"^[\s#*_-]*(\d+[.)])?[\s*_]*")
+
+
+def _normalize_heading(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", " ", text.lower()).strip()
+
+
+def _heading_name(line: str, wanted: Dict[str, str]):
+    """
+    Matches "### No Mask", "**No Mask:**", "2. No Mask", "**1. No Mask**".
+    Returns the violation name or None.
+    """
+    return wanted.get(_normalize_heading(HEADING_MARKUP.sub("", line)))
+
+
+def _parse_sections(text: str, names: List[str]) -> Dict[str, str]:
+    """
+    Splits "### <violation>" sectioned output back per violation.
+    Only the first line, or lines starting with #, ** or a number,
+    can open a section, so body text naming a violation stays body.
+    An unknown "#" heading closes the section only at the same or a
+    shallower depth than its opener; deeper ones (e.g. "#### What to do")
+    are kept as body. Sections opened without "#" are never closed by
+    unknown headings. Unknown or empty sections are dropped.
+    """
+
+    wanted = {_normalize_heading(n): n for n in names}
+    sections = {}
+    current = None
+    current_depth = 0
+    first = True
+
+    for line in text.splitlines():
+        if not line.strip():
+            if current is not None:
+                sections[current].append(line)
+            continue
+
+        is_heading = first or HEADING_START.match(line)
+        name = _heading_name(line, wanted) if is_heading else None
+        depth = len(line.lstrip()) - len(line.lstrip().lstrip("#"))
+        first = False
+
+        if name is not None:
+            current = name
+            current_depth = depth
+            sections[current] = []
+        elif depth and (current is None or 0 < depth <= current_depth):
+            current = None
+        elif current is not None:
+            sections[current].append(line)
+
+    return {
+        name: "\n".join(lines).strip()
+        for name, lines in sections.items()
+        if "\n".join(lines).strip()
+    }
@@ -19,3 +19,35 @@ def aggregate_violations(events):
             aggregated[v["violation"]].append(e["frame"])
 
     return dict(aggregated)
+
+
+def summarize_violations(events):
+    """
+    Same grouping as aggregate_violations, plus the timing context
+    used by the batched LLM prompt:
+    {violation: {"frames", "count", "first_seen", "last_seen", "duration"}}
+    Times are in seconds; duration is the span between first and last sighting.
+    """
+
+    sightings = defaultdict(list)
+
+    for e in events:
+        for v in e.get("violations", []):
+            sightings[v["violation"]].append(
+                (e["frame"], e.get("timestamp", 0.0))
+            )
+
+    summary = {}
+
+    for violation, hits in sightings.items():
+        timestamps = [t for _, t in hits]
+
+        summary[violation] = {
+            "frames": [f for f, _ in hits],
+            "count": len(hits),
+            "first_seen": min(timestamps),
+            "last_seen": max(timestamps),
+            "duration": round(max(timestamps) - min(timestamps), 2)
+        }
+
+    return summary
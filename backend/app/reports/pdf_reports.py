@@ -0,0 +1,247 @@
+import io
+from datetime import datetime
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.utils import ImageReader, simpleSplit
+from reportlab.pdfgen import canvas
+
+MARGIN = 50
+LINE_HEIGHT = 14
+THUMB_WIDTH = 120
+TIMELINE_BINS = 200      # caps chart size regardless of video length
+TIMELINE_ROW_HEIGHT = 18
+
+SEVERITY_COLORS = {
+    "No Hard Hat": colors.HexColor("#d62728"),
+    "No Safety Vest": colors.HexColor("#ff7f0e"),
+    "No Mask": colors.HexColor("#1f77b4")
+}
+
+
+class SafetyReportBuilder:
+    """
+    Builds the safety audit PDF section by section.
+
+    Sections are drawn as soon as they are added, with page breaks as
+    needed. ReportLab keeps the pages in memory and writes the file in
+    close(). Each distinct thumbnail is embedded once as a PDF form.
+    """
+
+    def __init__(self, pdf_path: str, title: str = "AI Safety Audit Report"):
+        self.canvas = canvas.Canvas(pdf_path, pagesize=A4, pageCompression=1)
+        self.width, self.height = A4
+        self.page = 1
+        self._forms = {}
+
+        self.canvas.setTitle(title)
+        self.y = self.height - MARGIN
+
+        self._write(title, font="Helvetica-Bold", size=18)
+        self._write(
+            f"Generated: {datetime.now():%Y-%m-%d %H:%M}",
+            size=9,
+            color=colors.grey
+        )
+        self.y -= LINE_HEIGHT
+
+    # ----------------- LAYOUT -----------------
+    def _new_page(self):
+        self.canvas.setFont("Helvetica", 8)
+        self.canvas.setFillColor(colors.grey)
+        self.canvas.drawRightString(
+            self.width - MARGIN, MARGIN / 2, f"Page {self.page}"
+        )
+        self.canvas.showPage()
+        self.page += 1
+        self.y = self.height - MARGIN
+
+    def _ensure_space(self, needed: float):
+        if self.y - needed < MARGIN:
+            self._new_page()
+
+    def _write(self, text, font="Helvetica", size=11, color=colors.black):
+        lines = simpleSplit(str(text), font, size, self.width - 2 * MARGIN)
+
+        for line in lines:
+            self._ensure_space(LINE_HEIGHT)
+            self.canvas.setFont(font, size)
+            self.canvas.setFillColor(color)
+            self.canvas.drawString(MARGIN, self.y - size, line)
+            self.y -= max(LINE_HEIGHT, size + 4)
+
+    # ----------------- SECTIONS -----------------
+    def add_timeline(
+        self,
+        aggregated,
+        total_frames: int,
+        fps: float,
+        frame_skip: int = 1
+    ):
+        """
+        aggregated: {violation: [frame_ids]}
+        frame_skip: analyzer sampling step; each sample stands for
+        the frame_skip frames up to it
+        Draws one row per violation, frames bucketed into fixed bins.
+        """
+        if not aggregated or total_frames <= 0:
+            return
+
+        height = (len(aggregated) + 2) * TIMELINE_ROW_HEIGHT
+        self._ensure_space(height + 2 * LINE_HEIGHT)
+        self._write("Violation Timeline", font="Helvetica-Bold", size=14)
+
+        label_width = 100
+        left = MARGIN + label_width
+        chart_width = self.width - MARGIN - left
+        bin_width = chart_width / TIMELINE_BINS
+        c = self.canvas
+
+        for violation, frames in aggregated.items():
+            row_y = self.y - TIMELINE_ROW_HEIGHT
+
+            c.setFont("Helvetica", 9)
+            c.setFillColor(colors.black)
+            c.drawString(MARGIN, row_y + 4, violation)
+
+            c.setStrokeColor(colors.lightgrey)
+            c.rect(left, row_y + 2, chart_width, TIMELINE_ROW_HEIGHT - 6)
+
+            c.setFillColor(SEVERITY_COLORS.get(violation, colors.darkred))
+            for b in _timeline_bins(frames, total_frames, frame_skip):
+                c.rect(
+                    left + b * bin_width, row_y + 2,
+                    bin_width, TIMELINE_ROW_HEIGHT - 6,
+                    stroke=0, fill=1
+                )
+
+            self.y -= TIMELINE_ROW_HEIGHT
+
+        c.setFont("Helvetica", 8)
+        c.setFillColor(colors.grey)
+        c.drawString(left, self.y - 10, "0:00")
+        c.drawRightString(
+            left + chart_width, self.y - 10,
+            _format_time(total_frames / fps if fps else 0)
+        )
+        self.y -= 2 * LINE_HEIGHT
+
+    def add_violation(
+        self,
+        violation: str,
+        occurrences: int,
+        explanation: str,
+        thumbnails=None,
+        fps: float = None
+    ):
+        """
+        thumbnails: [(frame_id, key, jpeg_bytes)] from ThumbnailCache.get
+        """
+        self._ensure_space(4 * LINE_HEIGHT)
+        self._write(violation, font="Helvetica-Bold", size=14)
+        self._write(f"Occurrences: {occurrences}", size=10, color=colors.grey)
+
+        if thumbnails:
+            self._draw_thumbnails(thumbnails, fps)
+
+        self._write(explanation)
+        self.y -= LINE_HEIGHT
+
+    def _draw_thumbnails(self, thumbnails, fps):
+        gap = 10
+        per_row = int((self.width - 2 * MARGIN + gap) // (THUMB_WIDTH + gap))
+
+        for start in range(0, len(thumbnails), per_row):
+            row = [
+                (frame_id, *self._form(key, jpeg))
+                for frame_id, key, jpeg in thumbnails[start:start + per_row]
+            ]
+            row_height = max(h for _, _, h in row) + LINE_HEIGHT
+
+            self._ensure_space(row_height)
+            x = MARGIN
+
+            for frame_id, name, h in row:
+                self.canvas.saveState()
+                self.canvas.translate(x, self.y - h)
+                self.canvas.doForm(name)
+                self.canvas.restoreState()
+
+                caption = (
+                    _format_time(frame_id / fps) if fps else f"frame {frame_id}"
+                )
+                self.canvas.setFont("Helvetica", 8)
+                self.canvas.setFillColor(colors.grey)
+                self.canvas.drawString(x, self.y - h - 10, caption)
+
+                x += THUMB_WIDTH + gap
+
+            self.y -= row_height + 4
+
+    def _form(self, key: str, jpeg: bytes):
+        """
+        Registers a thumbnail as a reusable form XObject (once per key).
+        Returns (form_name, drawn_height).
+        """
+        if key not in self._forms:
+            image = ImageReader(io.BytesIO(jpeg))
+            w, h = image.getSize()
+            height = THUMB_WIDTH * h / w
+            name = f"thumb_{key}"
+
+            self.canvas.beginForm(name, 0, 0, THUMB_WIDTH, height)
+            self.canvas.drawImage(image, 0, 0, THUMB_WIDTH, height)
+            self.canvas.endForm()
+
+            self._forms[key] = (name, height)
+
+        return self._forms[key]
+
+    def close(self):
+        self._new_page()
+        self.canvas.save()
+
+
+def _timeline_bins(frames, total_frames: int, frame_skip: int = 1):
+    """
+    Maps sampled frame ids onto TIMELINE_BINS buckets; returns the
+    occupied ones. Sample f covers frames (f - frame_skip, f], so
+    consecutive samples fill an unbroken range of bins.
+    """
+    bins = set()
+
+    for f in frames:
+        first = min(
+            max((f - frame_skip) * TIMELINE_BINS // total_frames, 0),
+            TIMELINE_BINS - 1
+        )
+        last = min(
+            -(-f * TIMELINE_BINS // total_frames) - 1,    # ceil, exclusive
+            TIMELINE_BINS - 1
+        )
+        bins.update(range(first, max(last, first) + 1))
+
+    return sorted(bins)
+
+
+def _format_time(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    return f"{minutes}:{seconds:02d}"
+
+
+def generate_pdf(pdf_path: str, summary):
+    """
+    summary: List[{"violation": str, "occurrences": int, "explanation": str}]
+    """
+    builder = SafetyReportBuilder(pdf_path)
+
+    for item in summary:
+        builder.add_violation(
+            item["violation"],
+            item["occurrences"],
+            item["explanation"]
+        )
+
+    builder.close()
+
+    return pdf_path
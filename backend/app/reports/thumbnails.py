@@ -0,0 +1,120 @@
+from collections import defaultdict
+
+import cv2
+
+# dHash bits (out of 256) two thumbnails may differ by and still count
+# as the same scene; a worker moving in a fixed camera view exceeds this
+DUPLICATE_DISTANCE = 4
+
+
+class ThumbnailCache:
+    """
+    Keeps a bounded set of JPEG thumbnails per violation type,
+    filled from frames already decoded during video analysis.
+
+    - per_violation: max thumbnails kept for each violation type
+    - a frame nearly identical to the last thumbnail kept for the same
+      violation (16x16 dHash within DUPLICATE_DISTANCE) is skipped
+    - samples stay spread across the whole video: when a violation
+      overflows its budget every other thumbnail is dropped and
+      the sampling stride doubles
+    """
+
+    def __init__(
+        self,
+        per_violation: int = 4,
+        max_width: int = 320,
+        jpeg_quality: int = 70
+    ):
+        self.per_violation = per_violation
+        self.max_width = max_width
+        self.jpeg_quality = jpeg_quality
+
+        self.images = {}                      # frame_id -> jpeg bytes
+        self._hashes = {}                     # frame_id -> dHash
+        self._frames = defaultdict(list)      # violation -> [frame_id]
+        self._stride = defaultdict(lambda: 1)
+        self._seen = defaultdict(int)
+
+    def add(self, frame_id: int, frame, violations):
+        wanted = []
+        for v in violations:
+            name = v["violation"]
+            if self._seen[name] % self._stride[name] == 0:
+                wanted.append(name)
+            self._seen[name] += 1
+
+        if not wanted:
+            return
+
+        thumb = self._downscale(frame)
+        frame_hash = _difference_hash(thumb)
+
+        wanted = [
+            name for name in wanted
+            if not self._frames[name] or _hamming(
+                self._hashes[self._frames[name][-1]], frame_hash
+            ) > DUPLICATE_DISTANCE
+        ]
+
+        if not wanted:
+            return
+
+        ok, buf = cv2.imencode(
+            ".jpg", thumb, [cv2.IMWRITE_JPEG_QUALITY, self.jpeg_quality]
+        )
+        if not ok:
+            return
+
+        # One entry per frame, shared by every violation it shows
+        self.images[frame_id] = buf.tobytes()
+        self._hashes[frame_id] = frame_hash
+
+        for name in wanted:
+            frames = self._frames[name]
+            frames.append(frame_id)
+
+            if len(frames) > self.per_violation:
+                self._frames[name] = frames[::2]
+                self._stride[name] *= 2
+
+        self._drop_unreferenced()
+
+    def get(self, violation: str):
+        """
+        Returns [(frame_id, key, jpeg_bytes)] in frame order.
+        key identifies the image, so repeated frames embed once.
+        """
+        return [
+            (frame_id, str(frame_id), self.images[frame_id])
+            for frame_id in self._frames.get(violation, [])
+        ]
+
+    def _downscale(self, frame):
+        h, w = frame.shape[:2]
+        if w <= self.max_width:
+            return frame
+
+        scale = self.max_width / w
+        return cv2.resize(
+            frame,
+            (self.max_width, int(h * scale)),
+            interpolation=cv2.INTER_AREA
+        )
+
+    def _drop_unreferenced(self):
+        used = {f for frames in self._frames.values() for f in frames}
+        for frame_id in self.images.keys() - used:
+            del self.images[frame_id]
+            del self._hashes[frame_id]
+
+
+def _difference_hash(img, size: int = 16) -> int:
+    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    small = cv2.resize(gray, (size + 1, size), interpolation=cv2.INTER_AREA)
+    bits = (small[:, 1:] > small[:, :-1]).flatten()
+    return int("".join("1" if b else "0" for b in bits), 2)
+
+
+def _hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
@@ -0,0 +1,120 @@
+import numpy as np
+
+from app.cv.backends import OnnxRuntimeBackend, _class_aware_nms
+
+
+class FakeSession:
+    """Returns a fixed YOLOv8-style head output: (1, 4 + nc, anchors)."""
+
+    def __init__(self, anchors):
+        self.anchors = anchors
+
+    def run(self, _, feed):
+        preds = np.zeros((1, 4 + 6, len(self.anchors)), np.float32)
+        for i, (xywh, cls_id, conf) in enumerate(self.anchors):
+            preds[0, :4, i] = xywh
+            preds[0, 4 + cls_id, i] = conf
+        return [preds]
+
+
+def make_backend(anchors, imgsz=(640, 640)):
+    backend = OnnxRuntimeBackend.__new__(OnnxRuntimeBackend)
+    backend.imgsz = imgsz
+    backend.input_name = "images"
+    backend.session = FakeSession(anchors)
+    return backend
+
+
+def test_nms_suppresses_overlaps_within_class_only():
+    xyxy = np.array([
+        [0, 0, 10, 10],
+        [1, 1, 10, 10],     # overlaps box 0, same class
+        [0, 0, 10, 10]      # same box, other class
+    ], dtype=float)
+    confs = np.array([0.9, 0.8, 0.7])
+    cls_ids = np.array([0, 0, 1])
+
+    assert list(_class_aware_nms(xyxy, confs, cls_ids)) == [0, 2]
+
+
+def test_nms_keeps_disjoint_boxes_in_confidence_order():
+    xyxy = np.array([[0, 0, 10, 10], [50, 50, 60, 60]], dtype=float)
+    confs = np.array([0.4, 0.9])
+    cls_ids = np.array([3, 3])
+
+    assert list(_class_aware_nms(xyxy, confs, cls_ids)) == [1, 0]
+
+
+def test_letterbox_pads_to_square_input():
+    backend = make_backend([])
+    img, gain, (pad_x, pad_y) = backend._letterbox(
+        np.zeros((480, 720, 3), np.uint8)
+    )
+
+    assert img.shape == (640, 640, 3)
+    assert gain == 640 / 720
+    assert (pad_x, pad_y) == (0, 106)
+
+
+def test_predict_rescales_boxes_to_original_frame():
+    # 720x480 frame -> gain 640/720, 106 px top padding
+    backend = make_backend([((320, 320, 100, 100), 3, 0.9)])
+    frame = np.zeros((480, 720, 3), np.uint8)
+
+    [box] = backend.predict(frame)
+    gain = 640 / 720
+
+    assert box["cls"] == 3
+    assert box["conf"] == np.float32(0.9)
+    np.testing.assert_allclose(box["xyxy"], (
+        270 / gain,
+        (270 - 106) / gain,
+        370 / gain,
+        (370 - 106) / gain
+    ), rtol=1e-5)
+
+
+def test_predict_clips_to_frame_and_drops_low_confidence():
+    backend = make_backend([
+        ((5, 320, 40, 40), 1, 0.8),       # spills past the left edge
+        ((320, 320, 50, 50), 2, 0.1)      # below CONF_THRESHOLD
+    ])
+    frame = np.zeros((640, 640, 3), np.uint8)
+
+    [box] = backend.predict(frame)
+
+    assert box["cls"] == 1
+    assert box["xyxy"][0] == 0.0
+
+
+def test_predict_without_detections():
+    assert make_backend([]).predict(np.zeros((64, 64, 3), np.uint8)) == []
+
+
+def test_compare_backends_counts_only_readable_images(tmp_path):
+    import cv2
+
+    from app.cv.export import compare_backends
+
+    class StubBackend:
+        def __init__(self, boxes):
+            self.boxes = boxes
+
+        def predict(self, frame):
+            return self.boxes
+
+    good = tmp_path / "good.png"
+    cv2.imwrite(str(good), np.zeros((32, 32, 3), np.uint8))
+    bad = tmp_path / "bad.jpg"
+    bad.write_bytes(b"not an image")
+
+    box = {"xyxy": (0, 0, 10, 10), "cls": 1, "conf": 0.9}
+    report = compare_backends(
+        StubBackend([box]),
+        StubBackend([dict(box, conf=0.8)]),
+        [str(good), str(bad)]
+    )
+
+    assert report["images"] == 1
+    assert report["recall_vs_reference"] == 1.0
+    assert abs(report["mean_conf_delta"] - 0.1) < 1e-9
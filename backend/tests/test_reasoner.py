@@ -0,0 +1,180 @@
+import pytest
+
+from app.llm import reasoner
+from app.llm.reasoner import _parse_sections, explain_aggregated_violations
+from app.logic.aggregator import summarize_violations
+
+NAMES = ["No Hard Hat", "No Safety Vest", "No Mask"]
+
+EVENTS = [
+    {
+        "frame": 10,
+        "timestamp": 0.4,
+        "violations": [{"violation": "No Hard Hat"}, {"violation": "No Mask"}]
+    },
+    {
+        "frame": 50,
+        "timestamp": 2.0,
+        "violations": [{"violation": "No Hard Hat"}, {"violation": "No Safety Vest"}]
+    },
+    {"frame": 90, "timestamp": 3.6, "violations": []}
+]
+
+
+class StubLLM:
+    def __init__(self, batch_answer):
+        self.batch_answer = batch_answer
+        self.prompts = []
+
+    def invoke(self, prompt):
+        self.prompts.append(prompt)
+        if "### " in prompt:
+            return self.batch_answer
+        return " single answer "
+
+
+# ----------------- AGGREGATION -----------------
+def test_summarize_violations_counts_and_timestamps():
+    summary = summarize_violations(EVENTS)
+
+    assert summary["No Hard Hat"] == {
+        "frames": [10, 50],
+        "count": 2,
+        "first_seen": 0.4,
+        "last_seen": 2.0,
+        "duration": 1.6
+    }
+    assert summary["No Mask"]["duration"] == 0.0
+    assert list(summary) == ["No Hard Hat", "No Mask", "No Safety Vest"]
+
+
+def test_summarize_violations_without_violations():
+    assert summarize_violations([EVENTS[-1]]) == {}
+
+
+# ----------------- SECTION PARSING -----------------
+def test_parse_well_formed_sections():
+    text = (
+        "### No Hard Hat\nHead injury risk.\n\n"
+        "### No Safety Vest\nLow visibility.\n"
+        "### No Mask\nDust inhalation.\n"
+    )
+
+    assert _parse_sections(text, NAMES) == {
+        "No Hard Hat": "Head injury risk.",
+        "No Safety Vest": "Low visibility.",
+        "No Mask": "Dust inhalation."
+    }
+
+
+@pytest.mark.parametrize("heading", [
+    "## No Hard Hat",
+    "**No Hard Hat**",
+    "**No Hard Hat:**",
+    "1. No Hard Hat",
+    "1) No Hard Hat",
+    "**1. No Hard Hat**",
+    "### 1. **No Hard Hat**",
+])
+def test_parse_heading_variants(heading):
+    text = f"Here is the report.\n{heading}\nHead injury risk.\n**No Mask**\nDust."
+
+    assert _parse_sections(text, NAMES) == {
+        "No Hard Hat": "Head injury risk.",
+        "No Mask": "Dust."
+    }
+
+
+def test_body_line_naming_a_violation_stays_in_section():
+    text = "### No Hard Hat\nAlso check:\nNo Mask\nwas seen nearby.\n"
+
+    assert _parse_sections(text, NAMES) == {
+        "No Hard Hat": "Also check:\nNo Mask\nwas seen nearby."
+    }
+
+
+def test_deeper_sub_headings_stay_in_section():
+    text = (
+        "### No Hard Hat\nHead injury risk.\n"
+        "#### What to do\nStop work and issue a hard hat.\n"
+        "### No Mask\n#### Risk\nDust.\n#### What to do\nHand out masks.\n"
+        "## Overall\nSite is mostly fine.\n"
+    )
+
+    assert _parse_sections(text, NAMES) == {
+        "No Hard Hat": (
+            "Head injury risk.\n"
+            "#### What to do\nStop work and issue a hard hat."
+        ),
+        "No Mask": "#### Risk\nDust.\n#### What to do\nHand out masks."
+    }
+
+
+def test_bold_section_keeps_markdown_sub_headings():
+    text = "**No Hard Hat**\nRisk.\n### What to do\nIssue a hard hat.\n"
+
+    assert _parse_sections(text, NAMES) == {
+        "No Hard Hat": "Risk.\n### What to do\nIssue a hard hat."
+    }
+
+
+def test_unknown_and_empty_sections_are_dropped():
+    text = "### No Hard Hat\n\n### Summary\nOverall fine.\n### No Mask\nDust.\n"
+
+    assert _parse_sections(text, NAMES) == {"No Mask": "Dust."}
+
+
+# ----------------- BATCHED EXPLANATION -----------------
+def test_batch_uses_one_call(monkeypatch):
+    stub = StubLLM(
+        "### No Hard Hat\nA\n### No Mask\nB\n### No Safety Vest\nC\n"
+    )
+    monkeypatch.setattr(reasoner, "llm", stub)
+    monkeypatch.setattr(reasoner, "BATCH_MODE", True)
+
+    explanations = explain_aggregated_violations(summarize_violations(EVENTS))
+
+    assert explanations == {
+        "No Hard Hat": "A",
+        "No Mask": "B",
+        "No Safety Vest": "C"
+    }
+    assert len(stub.prompts) == 1
+    assert "first seen at 0.4s" in stub.prompts[0]
+
+
+def test_batch_falls_back_for_missing_sections(monkeypatch):
+    stub = StubLLM("**1. No Hard Hat**\nA\n")
+    monkeypatch.setattr(reasoner, "llm", stub)
+    monkeypatch.setattr(reasoner, "BATCH_MODE", True)
+
+    explanations = explain_aggregated_violations(summarize_violations(EVENTS))
+
+    assert explanations == {
+        "No Hard Hat": "A",
+        "No Mask": "single answer",
+        "No Safety Vest": "single answer"
+    }
+    assert len(stub.prompts) == 3
+
+
+def test_unparseable_batch_falls_back_to_per_item(monkeypatch):
+    stub = StubLLM("I cannot help with that.")
+    monkeypatch.setattr(reasoner, "llm", stub)
+    monkeypatch.setattr(reasoner, "BATCH_MODE", True)
+
+    explanations = explain_aggregated_violations(summarize_violations(EVENTS))
+
+    assert set(explanations.values()) == {"single answer"}
+    assert len(stub.prompts) == 4
+
+
+def test_batch_mode_off_uses_per_item_calls(monkeypatch):
+    stub = StubLLM("")
+    monkeypatch.setattr(reasoner, "llm", stub)
+    monkeypatch.setattr(reasoner, "BATCH_MODE", False)
+
+    explain_aggregated_violations(summarize_violations(EVENTS))
+
+    assert len(stub.prompts) == 3
+    assert not any("### " in p for p in stub.prompts)
@@ -0,0 +1,152 @@
+import numpy as np
+
+from app.reports import pdf_reports
+from app.reports.pdf_reports import (
+    SafetyReportBuilder,
+    TIMELINE_BINS,
+    _timeline_bins,
+    generate_pdf
+)
+from app.reports.thumbnails import ThumbnailCache
+
+NO_HAT = [{"violation": "No Hard Hat"}]
+
+
+def cctv_frame(worker_x: int):
+    """Fixed camera: same textured background, worker at worker_x."""
+    rng = np.random.default_rng(0)
+    frame = rng.integers(60, 90, (360, 640, 3)).astype(np.uint8)
+    frame[150:330, worker_x:worker_x + 60] = (20, 200, 240)
+    return frame
+
+
+# ----------------- THUMBNAIL CACHE -----------------
+def test_static_camera_with_moving_worker_keeps_several_thumbnails():
+    cache = ThumbnailCache(per_violation=4)
+
+    for f in range(10, 3010, 10):
+        cache.add(f, cctv_frame(20 + (f // 10) * 2 % 560), NO_HAT)
+
+    frames = [frame_id for frame_id, _, _ in cache.get("No Hard Hat")]
+    assert len(frames) > 1
+    assert frames == sorted(frames)
+
+
+def test_identical_consecutive_frames_are_deduplicated():
+    cache = ThumbnailCache(per_violation=4)
+
+    for f in range(10, 200, 10):
+        cache.add(f, cctv_frame(100), NO_HAT)
+
+    assert [f for f, _, _ in cache.get("No Hard Hat")] == [10]
+
+
+def test_budget_and_stride_spread_samples_over_video():
+    cache = ThumbnailCache(per_violation=4)
+
+    for f in range(1, 401):
+        cache.add(f, cctv_frame(f % 560), NO_HAT)
+
+    frames = [frame_id for frame_id, _, _ in cache.get("No Hard Hat")]
+    assert 2 <= len(frames) <= 4
+    assert frames[0] == 1
+    assert frames[-1] > 200           # not just the start of the video
+
+
+def test_frames_shared_by_violations_are_stored_once():
+    cache = ThumbnailCache(per_violation=2)
+    both = NO_HAT + [{"violation": "No Mask"}]
+
+    cache.add(10, cctv_frame(100), both)
+
+    assert cache.get("No Hard Hat")[0][1] == cache.get("No Mask")[0][1]
+    assert len(cache.images) == 1
+
+
+def test_unreferenced_images_are_dropped():
+    cache = ThumbnailCache(per_violation=2)
+
+    for f in range(1, 50):
+        cache.add(f, cctv_frame(f * 10 % 560), NO_HAT)
+
+    kept = {frame_id for frame_id, _, _ in cache.get("No Hard Hat")}
+    assert set(cache.images) == kept
+
+
+def test_thumbnails_are_downscaled_jpegs():
+    cache = ThumbnailCache(max_width=160)
+    cache.add(10, cctv_frame(100), NO_HAT)
+
+    [(_, _, jpeg)] = cache.get("No Hard Hat")
+    assert jpeg[:2] == b"\xff\xd8"
+
+
+# ----------------- PDF BUILDER -----------------
+def test_timeline_bins_are_bounded():
+    bins = _timeline_bins(range(0, 1_000_000, 7), 1_000_000)
+
+    assert bins[0] == 0
+    assert bins[-1] == TIMELINE_BINS - 1
+    assert len(bins) == TIMELINE_BINS
+
+
+def test_timeline_bins_clamp_last_frame():
+    assert _timeline_bins([100], 100)[-1] == TIMELINE_BINS - 1
+    assert _timeline_bins([5000], 100) == [TIMELINE_BINS - 1]
+
+
+def test_continuous_sampled_run_fills_unbroken_bins():
+    # 30 s at 25 fps, violation in every sample taken every 10 frames
+    bins = _timeline_bins(range(10, 751, 10), 750, frame_skip=10)
+
+    assert bins == list(range(TIMELINE_BINS))
+
+
+def test_gap_in_sampled_run_stays_visible():
+    frames = list(range(10, 301, 10)) + list(range(460, 751, 10))
+    bins = _timeline_bins(frames, 750, frame_skip=10)
+
+    assert bins[0] == 0 and bins[-1] == TIMELINE_BINS - 1
+    assert len(bins) < TIMELINE_BINS
+    assert 100 not in bins                # frame ~375 is uncovered
+
+
+def test_long_explanations_break_pages(tmp_path):
+    builder = SafetyReportBuilder(str(tmp_path / "report.pdf"))
+    builder.add_violation("No Hard Hat", 3, "Line.\n" * 200)
+    builder.close()
+
+    assert builder.page > 3
+
+
+def test_repeated_thumbnails_embed_one_image(tmp_path, monkeypatch):
+    cache = ThumbnailCache()
+    cache.add(10, cctv_frame(100), NO_HAT + [{"violation": "No Mask"}])
+
+    drawn = []
+    original = pdf_reports.canvas.Canvas.drawImage
+    monkeypatch.setattr(
+        pdf_reports.canvas.Canvas, "drawImage",
+        lambda self, *a, **k: drawn.append(a) or original(self, *a, **k)
+    )
+
+    path = tmp_path / "report.pdf"
+    builder = SafetyReportBuilder(str(path))
+    builder.add_timeline({"No Hard Hat": [10], "No Mask": [10]}, 100, 25)
+    builder.add_violation("No Hard Hat", 1, "x", cache.get("No Hard Hat"), 25)
+    builder.add_violation("No Mask", 1, "y", cache.get("No Mask"), 25)
+    builder.close()
+
+    assert len(drawn) == 1
+    assert len(builder._forms) == 1
+    assert path.read_bytes().count(b"/Subtype /Image") == 1
+
+
+def test_generate_pdf_writes_summary(tmp_path):
+    path = tmp_path / "summary.pdf"
+
+    generate_pdf(str(path), [
+        {"violation": "PPE Compliance", "occurrences": 5, "explanation": "ok"}
+    ])
+
+    assert path.read_bytes().startswith(b"%PDF")